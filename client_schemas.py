@@ -0,0 +1,59 @@
+"""
+Client Schemas Module for Polly API
+
+This module defines msgspec structs mirroring the response schemas in the
+OpenAPI specification. The client modules decode responses straight into
+these types, which validates them and gives fixed-field attribute access
+instead of dictionary lookups. The structs are frozen and hold tuples, so
+cached responses can be shared between callers safely.
+
+Classes:
+    UserOut: A registered user
+    Option: A poll option
+    Poll: A poll with its options (PollOut schema)
+    VoteOut: A vote cast on a poll option
+    OptionResult: The vote count of a single option
+    PollResults: The results of a poll
+"""
+
+from typing import Tuple
+
+import msgspec
+
+
+class UserOut(msgspec.Struct, frozen=True):
+    id: int
+    username: str
+
+
+class Option(msgspec.Struct, frozen=True):
+    id: int
+    text: str
+    poll_id: int
+
+
+class Poll(msgspec.Struct, frozen=True):
+    id: int
+    question: str
+    created_at: str
+    owner_id: int
+    options: Tuple[Option, ...] = ()
+
+
+class VoteOut(msgspec.Struct, frozen=True):
+    id: int
+    user_id: int
+    option_id: int
+    created_at: str
+
+
+class OptionResult(msgspec.Struct, frozen=True):
+    option_id: int
+    text: str
+    vote_count: int = 0
+
+
+class PollResults(msgspec.Struct, frozen=True):
+    poll_id: int
+    question: str
+    results: Tuple[OptionResult, ...] = ()
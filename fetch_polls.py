@@ -6,8 +6,12 @@ It supports both single-page fetching and complete data retrieval with proper er
 
 Functions:
     fetch_polls: Main function to fetch paginated polls with exception handling
+    fetch_polls_async: Async variant of fetch_polls over the shared HTTP/2 client
     fetch_polls_with_error_handling: Convenience function that returns None on failure
-    fetch_all_polls: Utility function to fetch all polls by making multiple requests
+    fetch_all_polls: Utility function to fetch all polls with concurrent paginated requests
+    fetch_all_polls_async: Async variant of fetch_all_polls using asyncio.gather
+    fetch_all_polls_iter: Generator that yields pages while the next ones are prefetched
+    iter_all_polls: Generator that yields polls one at a time, page by page
     print_polls_summary: Helper function to display poll data in a readable format
 
 Example:
@@ -17,33 +21,116 @@ Example:
     # Fetch all polls
     all_polls = fetch_all_polls()
     
+    # Process polls page by page while the next page is fetched
+    for page in fetch_all_polls_iter(batch_size=20):
+        print_polls_summary(page)
+    
     # Display polls
     print_polls_summary(polls)
 """
 
+import asyncio
+import queue
+import sys
+import threading
+import httpx
 import requests
-import json
-from typing import Dict, Any, List, Optional
+import msgspec
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional, Tuple
+
+from cachetools import TTLCache
+
+from client_schemas import Poll
+from http_session import async_request, coalesce, get_session
+
+
+# Pagination gives up after this many malformed pages in a row, e.g. when
+# base_url points at something that answers 200 with an HTML page
+MAX_CONSECUTIVE_INVALID_PAGES = 3
 
+# Built once at import; decodes a /polls page straight into Poll structs
+_POLLS_DECODER = msgspec.json.Decoder(Tuple[Poll, ...])
 
-def fetch_polls(skip: int = 0, limit: int = 10, base_url: str = "http://localhost:8000") -> List[Dict[str, Any]]:
+# Short-lived cache of /polls pages, keyed by (url, skip, limit). Pages are
+# stored as tuples of frozen structs and copied into a new list per caller.
+POLLS_CACHE_TTL = 10
+_POLLS_CACHE: TTLCache = TTLCache(maxsize=512, ttl=POLLS_CACHE_TTL)
+_POLLS_CACHE_LOCK = threading.Lock()
+
+
+def fetch_polls(skip: int = 0, limit: int = 10, base_url: str = "http://localhost:8000", bypass_cache: bool = False) -> List[Poll]:
     """
     Fetch paginated poll data from the /polls endpoint.
     
+    Pages are cached in-process for POLLS_CACHE_TTL seconds, so repeated calls
+    with the same arguments do not hit the network.
+    
     Args:
         skip (int): Number of items to skip (default: 0)
         limit (int): Maximum number of items to return (default: 10)
         base_url (str): The base URL of the API (default: "http://localhost:8000")
+        bypass_cache (bool): Skip the cache lookup and refresh the entry (default: False)
     
     Returns:
-        List[Dict[str, Any]]: List of poll objects following the PollOut schema
+        List[Poll]: List of polls following the PollOut schema
         
     Raises:
         requests.exceptions.RequestException: If the request fails
         ValueError: If the response is not valid
     """
-    url = f"{base_url}/polls"
+    return _fetch_polls(f"{base_url}/polls", skip, limit, bypass_cache)
+
+
+def _fetch_polls(url: str, skip: int, limit: int, bypass_cache: bool) -> List[Poll]:
+    """
+    Serve a /polls page from the cache or fetch it from a prebuilt URL.
+    
+    Shared by fetch_polls and PollyClient.fetch_polls.
+    
+    Args:
+        url (str): The /polls endpoint URL
+        skip (int): Number of items to skip
+        limit (int): Maximum number of items to return
+        bypass_cache (bool): Skip the cache lookup and refresh the entry
+    
+    Returns:
+        List[Poll]: List of polls following the PollOut schema
+    """
+    cache_key = (url, skip, limit)
+    
+    def cached_page() -> Optional[Tuple[Poll, ...]]:
+        if bypass_cache:
+            return None
+        with _POLLS_CACHE_LOCK:
+            return _POLLS_CACHE.get(cache_key)
+    
+    def fetch() -> Tuple[Poll, ...]:
+        # A previous leader may have stored the page since our miss
+        cached = cached_page()
+        return cached if cached is not None else _request_polls(url, skip, limit, cache_key)
     
+    cached = cached_page()
+    if cached is not None:
+        return list(cached)
+    
+    # Concurrent misses for the same page share a single request
+    return list(coalesce(("polls",) + cache_key, fetch))
+
+
+def _request_polls(url: str, skip: int, limit: int, cache_key: tuple) -> Tuple[Poll, ...]:
+    """
+    Perform the /polls GET request and store the page in the cache.
+    
+    Args:
+        url (str): The /polls endpoint URL
+        skip (int): Number of items to skip
+        limit (int): Maximum number of items to return
+        cache_key (tuple): Key under which the page is cached
+    
+    Returns:
+        Tuple[Poll, ...]: The cached page of polls (PollOut schema)
+    """
     # Prepare query parameters
     params = {
         "skip": skip,
@@ -52,26 +139,83 @@ def fetch_polls(skip: int = 0, limit: int = 10, base_url: str = "http://localhos
     
     try:
         # Make the GET request
-        response = requests.get(url, params=params)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            polls_data = response.json()
-            
-            # Validate that we received a list
-            if not isinstance(polls_data, list):
-                raise ValueError("Expected a list of polls, but received a different data type")
-            
-            return polls_data
-        else:
-            # Handle error status codes
-            response.raise_for_status()
-            
+        response = get_session().get(url, params=params)
+        return _parse_polls_response(response, cache_key)
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
 
 
-def fetch_polls_with_error_handling(skip: int = 0, limit: int = 10, base_url: str = "http://localhost:8000") -> Optional[List[Dict[str, Any]]]:
+def _parse_polls_response(response: Any, cache_key: tuple) -> Tuple[Poll, ...]:
+    """
+    Validate a /polls response and store the page in the cache.
+    
+    Works with both requests and httpx responses; error statuses raise the
+    respective library's HTTP error via raise_for_status.
+    
+    Args:
+        response (Any): The HTTP response for the /polls request
+        cache_key (tuple): Key under which the page is cached
+    
+    Returns:
+        Tuple[Poll, ...]: The cached page of polls (PollOut schema)
+    """
+    # Check if the request was successful
+    if response.status_code == 200:
+        # Decode and validate the page against the PollOut schema
+        try:
+            polls_data = _POLLS_DECODER.decode(response.content)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid polls response: {e}")
+        
+        with _POLLS_CACHE_LOCK:
+            _POLLS_CACHE[cache_key] = polls_data
+        return polls_data
+    else:
+        # Handle error status codes
+        response.raise_for_status()
+
+
+async def fetch_polls_async(skip: int = 0, limit: int = 10, base_url: str = "http://localhost:8000", bypass_cache: bool = False) -> List[Poll]:
+    """
+    Async variant of fetch_polls using the shared HTTP/2 httpx.AsyncClient.
+    
+    Shares the page cache with fetch_polls and raises the same exceptions.
+    
+    Args:
+        skip (int): Number of items to skip (default: 0)
+        limit (int): Maximum number of items to return (default: 10)
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+        bypass_cache (bool): Skip the cache lookup and refresh the entry (default: False)
+    
+    Returns:
+        List[Poll]: List of polls following the PollOut schema
+        
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+        ValueError: If the response is not valid
+    """
+    url = f"{base_url}/polls"
+    cache_key = (url, skip, limit)
+    
+    if not bypass_cache:
+        with _POLLS_CACHE_LOCK:
+            cached = _POLLS_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached)
+    
+    params = {
+        "skip": skip,
+        "limit": limit
+    }
+    
+    try:
+        response = await async_request("GET", url, params=params)
+        return list(_parse_polls_response(response, cache_key))
+    except httpx.HTTPError as e:
+        raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
+
+
+def fetch_polls_with_error_handling(skip: int = 0, limit: int = 10, base_url: str = "http://localhost:8000") -> Optional[List[Poll]]:
     """
     Fetch paginated poll data with basic error handling that returns None on failure.
     
@@ -81,7 +225,7 @@ def fetch_polls_with_error_handling(skip: int = 0, limit: int = 10, base_url: st
         base_url (str): The base URL of the API (default: "http://localhost:8000")
     
     Returns:
-        Optional[List[Dict[str, Any]]]: List of poll objects on success, None on failure
+        Optional[List[Poll]]: List of poll objects on success, None on failure
     """
     try:
         return fetch_polls(skip, limit, base_url)
@@ -90,69 +234,261 @@ def fetch_polls_with_error_handling(skip: int = 0, limit: int = 10, base_url: st
         return None
 
 
-def fetch_all_polls(base_url: str = "http://localhost:8000", batch_size: int = 10) -> List[Dict[str, Any]]:
+def fetch_all_polls(base_url: str = "http://localhost:8000", batch_size: int = 10, concurrency: int = 8) -> List[Poll]:
     """
     Fetch all polls by making multiple paginated requests.
     
+    Pages are requested concurrently in waves of ``concurrency`` offsets
+    (``0, batch_size, 2 * batch_size, ...``), so each wave costs roughly one
+    round-trip instead of one round-trip per page. Fetching stops at the first
+    empty or short page, or after MAX_CONSECUTIVE_INVALID_PAGES malformed pages in a row.
+    
+    Args:
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+        batch_size (int): Number of polls to fetch per request (default: 10)
+        concurrency (int): Number of pages to request in parallel (default: 8)
+    
+    Returns:
+        List[Poll]: Complete list of all polls
+    
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    
+    all_polls = []
+    skip = 0
+    invalid_pages = 0
+    
+    def fetch_page(page_skip: int) -> List[Poll]:
+        return fetch_polls(skip=page_skip, limit=batch_size, base_url=base_url)
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            offsets = [skip + i * batch_size for i in range(concurrency)]
+            futures = [executor.submit(fetch_page, offset) for offset in offsets]
+            
+            # Consume pages in offset order so the result keeps server ordering
+            for offset, future in zip(offsets, futures):
+                try:
+                    polls_batch = future.result()
+                except ValueError as e:
+                    # A malformed page does not mean the listing has ended,
+                    # but a run of them means nothing useful will follow
+                    invalid_pages += 1
+                    if invalid_pages >= MAX_CONSECUTIVE_INVALID_PAGES:
+                        print(f"Stopping after {invalid_pages} invalid polls batches in a row at {offset}: {e}")
+                        return all_polls
+                    print(f"Skipping invalid polls batch starting at {offset}: {e}")
+                    continue
+                except Exception as e:
+                    # Transient failures were already retried by the session
+                    print(f"Error fetching polls batch starting at {offset}: {e}")
+                    return all_polls
+                
+                invalid_pages = 0
+                
+                # If we get an empty list, we've reached the end
+                if not polls_batch:
+                    return all_polls
+                    
+                all_polls.extend(polls_batch)
+                
+                # If we got fewer polls than requested, we've reached the end
+                if len(polls_batch) < batch_size:
+                    return all_polls
+            
+            skip += concurrency * batch_size
+
+
+async def fetch_all_polls_async(base_url: str = "http://localhost:8000", batch_size: int = 10, concurrency: int = 8) -> List[Poll]:
+    """
+    Async variant of fetch_all_polls that gathers each wave of pages on one event loop.
+    
     Args:
         base_url (str): The base URL of the API (default: "http://localhost:8000")
         batch_size (int): Number of polls to fetch per request (default: 10)
+        concurrency (int): Number of pages to request in parallel (default: 8)
     
     Returns:
-        List[Dict[str, Any]]: Complete list of all polls
+        List[Poll]: Complete list of all polls
+    
+    Raises:
+        ValueError: If concurrency is less than 1
     """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    
     all_polls = []
     skip = 0
+    invalid_pages = 0
     
     while True:
-        try:
-            polls_batch = fetch_polls(skip=skip, limit=batch_size, base_url=base_url)
+        offsets = [skip + i * batch_size for i in range(concurrency)]
+        pages = await asyncio.gather(
+            *(fetch_polls_async(skip=offset, limit=batch_size, base_url=base_url) for offset in offsets),
+            return_exceptions=True,
+        )
+        
+        # Consume pages in offset order so the result keeps server ordering
+        for offset, polls_batch in zip(offsets, pages):
+            if isinstance(polls_batch, ValueError):
+                # A malformed page does not mean the listing has ended,
+                # but a run of them means nothing useful will follow
+                invalid_pages += 1
+                if invalid_pages >= MAX_CONSECUTIVE_INVALID_PAGES:
+                    print(f"Stopping after {invalid_pages} invalid polls batches in a row at {offset}: {polls_batch}")
+                    return all_polls
+                print(f"Skipping invalid polls batch starting at {offset}: {polls_batch}")
+                continue
+            if isinstance(polls_batch, Exception):
+                print(f"Error fetching polls batch starting at {offset}: {polls_batch}")
+                return all_polls
+            
+            invalid_pages = 0
             
             # If we get an empty list, we've reached the end
             if not polls_batch:
-                break
-                
+                return all_polls
+            
             all_polls.extend(polls_batch)
             
             # If we got fewer polls than requested, we've reached the end
             if len(polls_batch) < batch_size:
-                break
+                return all_polls
+        
+        skip += concurrency * batch_size
+
+
+def fetch_all_polls_iter(base_url: str = "http://localhost:8000", batch_size: int = 10, prefetch: int = 2) -> Iterator[List[Poll]]:
+    """
+    Yield pages of polls while the following pages are fetched in the background.
+    
+    A producer thread requests pages in order and pushes them into a bounded
+    queue, so the network round-trip for page N+1 overlaps with the caller's
+    processing of page N. At most ``prefetch`` pages are buffered at a time.
+    
+    Args:
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+        batch_size (int): Number of polls to fetch per request (default: 10)
+        prefetch (int): Maximum number of pages fetched ahead of the consumer (default: 2)
+    
+    Yields:
+        List[Poll]: One page of poll objects at a time
+    """
+    pages: queue.Queue = queue.Queue(maxsize=max(prefetch, 1))
+    stop = threading.Event()
+    
+    def put(item: Optional[List[Poll]]) -> bool:
+        # Block while the queue is full, but give up once the consumer is gone
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce() -> None:
+        skip = 0
+        invalid_pages = 0
+        try:
+            while not stop.is_set():
+                try:
+                    polls_batch = fetch_polls(skip=skip, limit=batch_size, base_url=base_url)
+                except ValueError as e:
+                    # A malformed page does not mean the listing has ended,
+                    # but a run of them means nothing useful will follow
+                    invalid_pages += 1
+                    if invalid_pages >= MAX_CONSECUTIVE_INVALID_PAGES:
+                        print(f"Stopping after {invalid_pages} invalid polls batches in a row at {skip}: {e}")
+                        return
+                    print(f"Skipping invalid polls batch starting at {skip}: {e}")
+                    skip += batch_size
+                    continue
+                except Exception as e:
+                    # Transient failures were already retried by the session
+                    print(f"Error fetching polls batch starting at {skip}: {e}")
+                    return
                 
-            skip += batch_size
-            
-        except Exception as e:
-            print(f"Error fetching polls batch starting at {skip}: {e}")
-            break
+                invalid_pages = 0
+                
+                # If we get an empty list, we've reached the end
+                if not polls_batch or not put(polls_batch):
+                    return
+                
+                # If we got fewer polls than requested, we've reached the end
+                if len(polls_batch) < batch_size:
+                    return
+                
+                skip += batch_size
+        finally:
+            # None is the end-of-stream sentinel
+            put(None)
+    
+    producer = threading.Thread(target=produce, name="fetch-polls-prefetch", daemon=True)
+    producer.start()
+    
+    try:
+        while True:
+            polls_batch = pages.get()
+            if polls_batch is None:
+                return
+            yield polls_batch
+    finally:
+        stop.set()
+
+
+def iter_all_polls(base_url: str = "http://localhost:8000", batch_size: int = 10, prefetch: int = 2) -> Iterator[Poll]:
+    """
+    Yield every poll one at a time without building the full list in memory.
     
-    return all_polls
+    Pages come from fetch_all_polls_iter, so only the current page and up to
+    ``prefetch`` pages fetched ahead are held at any time.
+    
+    Args:
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+        batch_size (int): Number of polls to fetch per request (default: 10)
+        prefetch (int): Maximum number of pages fetched ahead of the consumer (default: 2)
+    
+    Yields:
+        Poll: One poll at a time, in server order
+    """
+    for polls_batch in fetch_all_polls_iter(base_url=base_url, batch_size=batch_size, prefetch=prefetch):
+        yield from polls_batch
 
 
-def print_polls_summary(polls: List[Dict[str, Any]]) -> None:
+def print_polls_summary(polls: List[Poll]) -> None:
     """
     Print a summary of the fetched polls.
     
     Args:
-        polls (List[Dict[str, Any]]): List of poll objects
+        polls (List[Poll]): List of poll objects
     """
     if not polls:
         print("No polls found.")
         return
     
-    print(f"Found {len(polls)} polls:")
-    print("-" * 50)
+    # Build the whole summary first and write it in one call
+    separator = "-" * 50
+    parts = [f"Found {len(polls)} polls:\n{separator}\n"]
     
     for poll in polls:
-        print(f"ID: {poll.get('id', 'N/A')}")
-        print(f"Question: {poll.get('question', 'N/A')}")
-        print(f"Created: {poll.get('created_at', 'N/A')}")
-        print(f"Owner ID: {poll.get('owner_id', 'N/A')}")
-        
-        options = poll.get('options', [])
-        print(f"Options ({len(options)}):")
+        options = poll.options
+        parts.append(
+            f"ID: {poll.id}\n"
+            f"Question: {poll.question}\n"
+            f"Created: {poll.created_at}\n"
+            f"Owner ID: {poll.owner_id}\n"
+            f"Options ({len(options)}):\n"
+        )
         for option in options:
-            print(f"  - {option.get('text', 'N/A')} (ID: {option.get('id', 'N/A')})")
+            parts.append(f"  - {option.text} (ID: {option.id})\n")
         
-        print("-" * 50)
+        parts.append(f"{separator}\n")
+    
+    sys.stdout.write("".join(parts))
 
 
 # Example usage
@@ -0,0 +1,293 @@
+"""
+Shared HTTP Session Module for Polly API clients
+
+This module owns the single requests.Session used by the client modules
+(register_user, fetch_polls, vote_and_results). Reusing one session keeps
+HTTP/1.1 connections alive between calls, so only the first request to a
+host pays for the TCP (and TLS) handshake.
+
+The async helpers use an httpx.AsyncClient with HTTP/2 enabled, so many
+concurrent requests to an HTTPS server are multiplexed over one connection.
+They follow the same retry policy as the session: the transport retries
+failed connects and async_request retries the RETRY_STATUS_FORCELIST statuses.
+
+Functions:
+    get_session: Return the shared session, creating it on first use
+    close_session: Close the shared session and release pooled connections
+    session_scope: Context manager that closes the shared session on exit
+    warm: Open a pooled connection to a base URL in the background
+    coalesce: Share one call between concurrent callers asking for the same key
+    get_async_client: Return the httpx.AsyncClient for the running event loop
+    close_async_client: Close the async client of the running event loop
+    async_request: Send a request on the async client, retrying transient statuses
+    run_async: Run a coroutine to completion from synchronous code
+
+Example:
+    # Reuse pooled connections for a batch of calls
+    with session_scope() as session:
+        response = session.get("http://localhost:8000/polls")
+"""
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Hashable, Iterator, Optional, Set, TypeVar
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Connection pool settings for the shared session
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+ASYNC_MAX_CONNECTIONS = 50
+WARMUP_TIMEOUT = 2
+
+# Transient failures are retried by the adapter with exponential backoff
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_FORCELIST = (502, 503, 504)
+RETRY_ALLOWED_METHODS = ("GET", "POST")
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+# Base URLs the shared session has already connected to
+_WARMED: Set[str] = set()
+_WARM_LOCK = threading.Lock()
+
+# Calls currently in flight, keyed by the caller-supplied request key
+_INFLIGHT: Dict[Hashable, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# An AsyncClient is bound to the event loop it is used on, so keep one per loop
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+T = TypeVar("T")
+
+
+def _create_session() -> requests.Session:
+    """
+    Build a session with pooled, retrying adapters for http:// and https://.
+
+    Returns:
+        requests.Session: A new configured session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            allowed_methods=RETRY_ALLOWED_METHODS,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared session, creating it on first use.
+
+    Returns:
+        requests.Session: The process-wide session used by the client modules
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _create_session()
+    return _SESSION
+
+
+def close_session() -> None:
+    """
+    Close the shared session and release its pooled connections.
+
+    The next call to get_session creates a fresh session.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
+    with _WARM_LOCK:
+        _WARMED.clear()
+
+
+def warm(base_url: str) -> Optional[threading.Thread]:
+    """
+    Open a pooled connection to base_url in the background.
+    
+    Sends one cheap HEAD request per base URL through the shared session on a
+    daemon thread, which pays for DNS resolution and the TCP (and TLS)
+    handshake off the request path; later requests reuse the pooled
+    connection. Call it ahead of time, e.g. at startup; PollyClient calls it
+    on construction. Failures are ignored, the real request reports them.
+    
+    Args:
+        base_url (str): The base URL of the API, e.g. "http://localhost:8000"
+    
+    Returns:
+        Optional[threading.Thread]: The warm-up thread, or None if base_url was already warmed
+    """
+    with _WARM_LOCK:
+        if base_url in _WARMED:
+            return None
+        _WARMED.add(base_url)
+    
+    thread = threading.Thread(target=_probe, args=(base_url,), name="polly-warm", daemon=True)
+    thread.start()
+    return thread
+
+
+def _probe(base_url: str) -> None:
+    """
+    Send the warm-up HEAD request, swallowing any error.
+    
+    Args:
+        base_url (str): The base URL of the API
+    """
+    try:
+        get_session().head(base_url, timeout=WARMUP_TIMEOUT, allow_redirects=False)
+    except Exception:
+        # Warming is best effort and must never surface in a real call
+        pass
+
+
+@contextmanager
+def session_scope() -> Iterator[requests.Session]:
+    """
+    Provide the shared session and close it when the block exits.
+
+    Yields:
+        requests.Session: The shared session
+    """
+    try:
+        yield get_session()
+    finally:
+        close_session()
+
+
+def coalesce(key: Hashable, fetch: Callable[[], T]) -> T:
+    """
+    Run fetch once for all concurrent callers that pass the same key.
+
+    The first caller for a key performs the call; callers arriving while it is
+    in flight wait for and share its result (or exception).
+
+    Args:
+        key (Hashable): Identifies the request, e.g. ("polls", url, skip, limit)
+        fetch (Callable[[], T]): Performs the request
+
+    Returns:
+        T: The value returned by fetch
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _INFLIGHT[key] = future
+
+    if not is_leader:
+        return future.result()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the shared httpx.AsyncClient for the running event loop.
+
+    The client negotiates HTTP/2 where the server supports it, so concurrent
+    requests gathered on the same loop share one connection.
+
+    Returns:
+        httpx.AsyncClient: The client bound to the running loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        # http2 and limits are transport settings once a transport is supplied
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=ASYNC_MAX_CONNECTIONS),
+            retries=RETRY_TOTAL,
+        )
+        client = httpx.AsyncClient(transport=transport)
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """
+    Close the async client of the running event loop, if one was created.
+    """
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def async_request(method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a request on the async client with the session's status retry policy.
+
+    Responses with a status in RETRY_STATUS_FORCELIST are retried with
+    exponential backoff for RETRY_ALLOWED_METHODS; connect failures are
+    retried by the client's transport. After the last attempt the response
+    is returned as is, so callers see the failing status.
+
+    Args:
+        method (str): HTTP method, e.g. "GET"
+        url (str): The request URL
+        **kwargs: Passed on to httpx.AsyncClient.request
+
+    Returns:
+        httpx.Response: The final response
+    """
+    client = get_async_client()
+    retries = RETRY_TOTAL if method.upper() in RETRY_ALLOWED_METHODS else 0
+    for attempt in range(retries + 1):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUS_FORCELIST or attempt == retries:
+            return response
+        await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** attempt)
+    return response
+
+
+def run_async(awaitable: Awaitable[T]) -> T:
+    """
+    Run an awaitable from synchronous code and close its async client afterwards.
+
+    Args:
+        awaitable (Awaitable[T]): The coroutine to run, e.g. fetch_polls_async()
+
+    Returns:
+        T: The value produced by the awaitable
+    """
+    async def runner() -> T:
+        try:
+            return await awaitable
+        finally:
+            await close_async_client()
+
+    return asyncio.run(runner())
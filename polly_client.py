@@ -0,0 +1,119 @@
+"""
+Polly API Client Module
+
+This module provides PollyClient, an object-oriented entry point to the
+Polly API client functions. The client builds its endpoint URLs once at
+construction, so each call only appends the path parameters, and it shares
+the pooled session, caches and token reuse of the function API. Creating a
+client starts warming a pooled connection to its base URL in the background.
+
+Classes:
+    PollyClient: Client bound to one API base URL
+
+Example:
+    from vote_and_results import print_poll_results
+    
+    client = PollyClient("http://localhost:8000")
+    
+    token = client.get_vote_token("testuser", "testpassword123")
+    client.cast_vote(poll_id=1, option_id=2, token=token)
+    
+    results = client.get_poll_results(poll_id=1)
+    print_poll_results(results)
+"""
+
+from typing import List, Optional
+
+from client_schemas import Poll, PollResults, UserOut, VoteOut
+from fetch_polls import _fetch_polls
+from http_session import warm
+from register_user import _register_user
+from vote_and_results import _cast_vote, _get_poll_results, _get_vote_token
+
+
+class PollyClient:
+    """
+    Client for the Polly API bound to a single base URL.
+    
+    Methods take the same arguments as the module-level functions, minus
+    base_url, and raise the same exceptions.
+    
+    Args:
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+        prewarm (bool): Open a pooled connection in the background right away (default: True)
+    """
+    
+    def __init__(self, base_url: str = "http://localhost:8000", prewarm: bool = True):
+        self._base = base_url.rstrip("/")
+        self._polls = f"{self._base}/polls"
+        self._register = f"{self._base}/register"
+        self._login = f"{self._base}/login"
+        if prewarm:
+            warm(self._base)
+    
+    def register_user(self, username: str, password: str) -> UserOut:
+        """
+        Register a new user via the /register endpoint.
+        
+        Args:
+            username (str): The username for the new user
+            password (str): The password for the new user
+        
+        Returns:
+            UserOut: The registered user (UserOut schema)
+        """
+        return _register_user(self._register, username, password)
+    
+    def get_vote_token(self, username: str, password: str) -> Optional[str]:
+        """
+        Log in and return a JWT token, reusing a cached one until it expires.
+        
+        Args:
+            username (str): Username for login
+            password (str): Password for login
+        
+        Returns:
+            Optional[str]: JWT token on success, None on failure
+        """
+        return _get_vote_token(self._login, self._base, username, password)
+    
+    def fetch_polls(self, skip: int = 0, limit: int = 10, bypass_cache: bool = False) -> List[Poll]:
+        """
+        Fetch paginated poll data from the /polls endpoint.
+        
+        Args:
+            skip (int): Number of items to skip (default: 0)
+            limit (int): Maximum number of items to return (default: 10)
+            bypass_cache (bool): Skip the cache lookup and refresh the entry (default: False)
+        
+        Returns:
+            List[Poll]: List of polls following the PollOut schema
+        """
+        return _fetch_polls(self._polls, skip, limit, bypass_cache)
+    
+    def cast_vote(self, poll_id: int, option_id: int, token: str) -> VoteOut:
+        """
+        Cast a vote on an existing poll via the /polls/{poll_id}/vote endpoint.
+        
+        Args:
+            poll_id (int): The ID of the poll to vote on
+            option_id (int): The ID of the option to vote for
+            token (str): JWT authentication token
+        
+        Returns:
+            VoteOut: The vote information (VoteOut schema)
+        """
+        return _cast_vote(f"{self._polls}/{poll_id}/vote", self._base, poll_id, option_id, token)
+    
+    def get_poll_results(self, poll_id: int, bypass_cache: bool = False) -> PollResults:
+        """
+        Retrieve poll results via the /polls/{poll_id}/results endpoint.
+        
+        Args:
+            poll_id (int): The ID of the poll to get results for
+            bypass_cache (bool): Skip the cache lookup and refresh the entry (default: False)
+        
+        Returns:
+            PollResults: The poll results (PollResults schema)
+        """
+        return _get_poll_results(f"{self._polls}/{poll_id}/results", self._base, poll_id, bypass_cache)
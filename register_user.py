@@ -23,11 +23,19 @@ Example:
 """
 
 import requests
-import json
-from typing import Dict, Any, Optional
+import msgspec
+import orjson
+from typing import Optional
 
+from client_schemas import UserOut
+from http_session import get_session
 
-def register_user(username: str, password: str, base_url: str = "http://localhost:8000") -> Dict[str, Any]:
+
+# Built once at import; decodes a /register response straight into UserOut
+_USER_DECODER = msgspec.json.Decoder(UserOut)
+
+
+def register_user(username: str, password: str, base_url: str = "http://localhost:8000") -> UserOut:
     """
     Register a new user via the /register endpoint.
     
@@ -37,14 +45,29 @@ def register_user(username: str, password: str, base_url: str = "http://localhos
         base_url (str): The base URL of the API (default: "http://localhost:8000")
     
     Returns:
-        Dict[str, Any]: The response data containing user information on success
+        UserOut: The registered user (UserOut schema) on success
         
     Raises:
         requests.exceptions.RequestException: If the request fails
         ValueError: If the registration fails (e.g., username already exists)
     """
-    url = f"{base_url}/register"
+    return _register_user(f"{base_url}/register", username, password)
+
+
+def _register_user(url: str, username: str, password: str) -> UserOut:
+    """
+    Register a user using a prebuilt /register URL.
+    
+    Shared by register_user and PollyClient.register_user.
     
+    Args:
+        url (str): The /register endpoint URL
+        username (str): The username for the new user
+        password (str): The password for the new user
+    
+    Returns:
+        UserOut: The registered user (UserOut schema) on success
+    """
     # Prepare the request data according to UserCreate schema
     data = {
         "username": username,
@@ -58,20 +81,23 @@ def register_user(username: str, password: str, base_url: str = "http://localhos
     
     try:
         # Make the POST request
-        response = requests.post(url, json=data, headers=headers)
+        response = get_session().post(url, data=orjson.dumps(data), headers=headers)
         
         # Check if the request was successful
         if response.status_code == 200:
             # Return the user data (UserOut schema)
-            return response.json()
+            try:
+                return _USER_DECODER.decode(response.content)
+            except msgspec.DecodeError as e:
+                raise ValueError(f"Invalid registration response: {e}")
         elif response.status_code == 400:
             # Username already registered
             error_msg = "Username already registered"
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 if "detail" in error_data:
                     error_msg = error_data["detail"]
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
             raise ValueError(f"Registration failed: {error_msg}")
         else:
@@ -82,7 +108,7 @@ def register_user(username: str, password: str, base_url: str = "http://localhos
         raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
 
 
-def register_user_with_error_handling(username: str, password: str, base_url: str = "http://localhost:8000") -> Optional[Dict[str, Any]]:
+def register_user_with_error_handling(username: str, password: str, base_url: str = "http://localhost:8000") -> Optional[UserOut]:
     """
     Register a new user with basic error handling that returns None on failure.
     
@@ -92,7 +118,7 @@ def register_user_with_error_handling(username: str, password: str, base_url: st
         base_url (str): The base URL of the API (default: "http://localhost:8000")
     
     Returns:
-        Optional[Dict[str, Any]]: The response data on success, None on failure
+        Optional[UserOut]: The registered user on success, None on failure
     """
     try:
         return register_user(username, password, base_url)
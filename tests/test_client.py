@@ -0,0 +1,752 @@
+import asyncio
+import base64
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import httpx
+import msgspec
+import numpy as np
+import pytest
+import requests
+
+import fetch_polls
+import http_session
+import polly_client
+import register_user
+import vote_and_results
+from client_schemas import Option, OptionResult, Poll, PollResults
+
+
+BASE_URL = "http://polly.test"
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b""):
+        self.status_code = status_code
+        self.content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession:
+    """Stands in for the shared requests.Session and records every call."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+
+    def _request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.handler(method, url, kwargs)
+
+    def get(self, url, **kwargs):
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._request("POST", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self._request("HEAD", url, **kwargs)
+
+
+def reset_caches():
+    fetch_polls._POLLS_CACHE.clear()
+    vote_and_results._RESULTS_CACHE.clear()
+    vote_and_results._RESULTS_STALE.clear()
+    vote_and_results._TOKEN_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    reset_caches()
+    yield
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Route the client modules through a FakeSession driven by a handler."""
+
+    def install(handler):
+        session = FakeSession(handler)
+        for module in (fetch_polls, http_session, register_user, vote_and_results):
+            monkeypatch.setattr(module, "get_session", lambda: session)
+        return session
+
+    return install
+
+
+def test_fetch_all_polls_stops_after_consecutive_invalid_pages(fake_session):
+    session = fake_session(lambda method, url, kwargs: FakeResponse(200, b"<html>"))
+
+    assert fetch_polls.fetch_all_polls(base_url=BASE_URL, concurrency=1) == []
+    assert len(session.calls) == fetch_polls.MAX_CONSECUTIVE_INVALID_PAGES
+
+
+def test_iter_all_polls_stops_after_consecutive_invalid_pages(fake_session):
+    session = fake_session(lambda method, url, kwargs: FakeResponse(200, b"<html>"))
+
+    assert list(fetch_polls.iter_all_polls(base_url=BASE_URL)) == []
+    assert len(session.calls) == fetch_polls.MAX_CONSECUTIVE_INVALID_PAGES
+
+
+@pytest.fixture
+def fake_async_client(monkeypatch):
+    """Serve the async client from an httpx.MockTransport driven by a handler."""
+
+    def install(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(http_session, "get_async_client", lambda: client)
+        monkeypatch.setattr(http_session, "RETRY_BACKOFF_FACTOR", 0)
+        return client
+
+    return install
+
+
+def test_async_request_retries_transient_statuses(fake_async_client):
+    statuses = [503, 502, 200]
+    fake_async_client(lambda request: httpx.Response(statuses.pop(0), content=b"[]"))
+
+    assert http_session.run_async(fetch_polls.fetch_polls_async(base_url=BASE_URL)) == []
+    assert statuses == []
+
+
+def test_async_request_returns_last_response_when_retries_are_spent(fake_async_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    fake_async_client(handler)
+
+    with pytest.raises(requests.exceptions.RequestException):
+        http_session.run_async(fetch_polls.fetch_polls_async(base_url=BASE_URL))
+    assert len(calls) == http_session.RETRY_TOTAL + 1
+
+
+def test_successful_vote_drops_cached_results(fake_session):
+    counts = iter([0, 1])
+
+    def handler(method, url, kwargs):
+        if method == "POST":
+            return FakeResponse(200, b'{"id": 1, "user_id": 1, "option_id": 2, "created_at": "2026-01-01T00:00:00"}')
+        body = f'{{"poll_id": 1, "question": "Q", "results": [{{"option_id": 2, "text": "b", "vote_count": {next(counts)}}}]}}'
+        return FakeResponse(200, body.encode())
+
+    fake_session(handler)
+
+    assert vote_and_results.get_poll_results(1, base_url=BASE_URL).results[0].vote_count == 0
+    vote_and_results.cast_vote(1, 2, token="t", base_url=BASE_URL)
+    assert vote_and_results.get_poll_results(1, base_url=BASE_URL).results[0].vote_count == 1
+
+
+POLLS_PAGE = b'[{"id": 1, "question": "Q", "created_at": "2026-01-01T00:00:00", "owner_id": 1, "options": [{"id": 1, "text": "a", "poll_id": 1}]}]'
+RESULTS_BODY = b'{"poll_id": 1, "question": "Q", "results": [{"option_id": 1, "text": "a", "vote_count": 3}]}'
+
+
+def test_fetch_polls_serves_repeat_calls_from_cache(fake_session):
+    session = fake_session(lambda method, url, kwargs: FakeResponse(200, POLLS_PAGE))
+
+    first = fetch_polls.fetch_polls(base_url=BASE_URL)
+    second = fetch_polls.fetch_polls(base_url=BASE_URL)
+
+    assert first == second
+    assert len(session.calls) == 1
+
+    fetch_polls.fetch_polls(base_url=BASE_URL, bypass_cache=True)
+    assert len(session.calls) == 2
+
+
+def test_cached_polls_are_not_shared_mutable_state(fake_session):
+    fake_session(lambda method, url, kwargs: FakeResponse(200, POLLS_PAGE))
+
+    fetch_polls.fetch_polls(base_url=BASE_URL).clear()
+
+    assert len(fetch_polls.fetch_polls(base_url=BASE_URL)) == 1
+
+
+def test_cached_results_are_immutable(fake_session):
+    fake_session(lambda method, url, kwargs: FakeResponse(200, RESULTS_BODY))
+
+    results = vote_and_results.get_poll_results(1, base_url=BASE_URL)
+
+    with pytest.raises(AttributeError):
+        results.results = ()
+    assert not hasattr(results.results, "clear")
+
+
+def test_get_poll_results_falls_back_to_stale_results(fake_session):
+    responses = [FakeResponse(200, RESULTS_BODY), FakeResponse(500)]
+    fake_session(lambda method, url, kwargs: responses.pop(0))
+
+    fresh = vote_and_results.get_poll_results(1, base_url=BASE_URL)
+    stale = vote_and_results.get_poll_results(1, base_url=BASE_URL, bypass_cache=True)
+
+    assert stale == fresh
+
+
+@pytest.fixture
+def warmed():
+    """Forget the base URLs a test warms."""
+    yield
+    http_session._WARMED.clear()
+
+
+def test_warm_probes_in_the_background_once_per_base_url(fake_session, warmed):
+    release = threading.Event()
+
+    def handler(method, url, kwargs):
+        release.wait(timeout=2)
+        return FakeResponse(404)
+
+    session = fake_session(handler)
+
+    thread = http_session.warm(BASE_URL)
+    # The caller does not wait for the probe
+    assert thread.is_alive()
+    assert http_session.warm(BASE_URL) is None
+
+    release.set()
+    thread.join(timeout=2)
+    assert [(method, url) for method, url, kwargs in session.calls] == [("HEAD", BASE_URL)]
+
+
+def test_warm_swallows_any_error(fake_session, warmed, monkeypatch):
+    def handler(method, url, kwargs):
+        raise AttributeError("unexpected")
+
+    fake_session(handler)
+    errors = []
+    monkeypatch.setattr(threading, "excepthook", errors.append)
+
+    http_session.warm(BASE_URL).join(timeout=2)
+
+    assert errors == []
+
+
+def test_request_path_sends_no_warm_up_request(fake_session):
+    session = fake_session(lambda method, url, kwargs: FakeResponse(200, POLLS_PAGE))
+
+    fetch_polls.fetch_polls(base_url=BASE_URL)
+
+    assert [method for method, url, kwargs in session.calls] == ["GET"]
+
+
+def test_top_k_order_matches_stable_full_sort():
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        # A small value range forces plenty of ties at the threshold
+        counts = rng.integers(0, 5, size=rng.integers(2, 30))
+        for top_k in range(1, len(counts)):
+            expected = np.argsort(-counts, kind="stable")[:top_k]
+            assert vote_and_results._top_k_order(counts, top_k).tolist() == expected.tolist()
+
+
+def make_jwt(claims):
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"e30.{payload}.signature"
+
+
+def test_token_expiry_reads_the_exp_claim():
+    assert vote_and_results._token_expiry(make_jwt({"sub": "alice", "exp": 1234567890})) == 1234567890
+    assert vote_and_results._token_expiry(make_jwt({"sub": "alice"})) is None
+    assert vote_and_results._token_expiry("not-a-jwt") is None
+    assert vote_and_results._token_expiry("a.!!!.c") is None
+
+
+@pytest.fixture
+def login_session(fake_session):
+    """Answer /login with a fresh token valid for an hour and votes with 401."""
+    issued = []
+
+    def handler(method, url, kwargs):
+        if url.endswith("/login"):
+            token = make_jwt({"sub": kwargs["data"]["username"], "exp": time.time() + 3600, "n": len(issued)})
+            issued.append(token)
+            return FakeResponse(200, json.dumps({"access_token": token}).encode())
+        return FakeResponse(401)
+
+    session = fake_session(handler)
+    session.issued = issued
+    return session
+
+
+def test_get_vote_token_reuses_cached_token(login_session):
+    first = vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL)
+
+    assert vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL) == first
+    assert len(login_session.issued) == 1
+
+
+def test_get_vote_token_logs_in_again_for_a_different_password(login_session):
+    first = vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL)
+
+    assert vote_and_results.get_vote_token("alice", "wrong", base_url=BASE_URL) != first
+    assert len(login_session.issued) == 2
+
+
+def test_invalidate_token_forces_a_new_login(login_session):
+    first = vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL)
+    vote_and_results.invalidate_token("alice", base_url=BASE_URL)
+
+    assert vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL) != first
+
+
+def test_rejected_vote_drops_the_cached_token(login_session):
+    token = vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL)
+
+    with pytest.raises(ValueError, match="Unauthorized"):
+        vote_and_results.cast_vote(1, 1, token=token, base_url=BASE_URL)
+
+    assert vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL) != token
+    assert len(login_session.issued) == 2
+
+
+def test_get_vote_token_renews_tokens_close_to_expiry(fake_session):
+    def handler(method, url, kwargs):
+        token = make_jwt({"exp": time.time() + vote_and_results.TOKEN_EXPIRY_MARGIN / 2})
+        return FakeResponse(200, json.dumps({"access_token": token}).encode())
+
+    session = fake_session(handler)
+    vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL)
+    vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL)
+
+    assert len(session.calls) == 2
+
+
+def run_coalesced(key, fetch, callers=8):
+    """Call coalesce from several threads that start together; return their outcomes."""
+    barrier = threading.Barrier(callers)
+    outcomes = [None] * callers
+
+    def call(index):
+        barrier.wait()
+        try:
+            outcomes[index] = http_session.coalesce(key, fetch)
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_coalesce_runs_one_fetch_for_concurrent_callers():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return object()
+
+    outcomes = run_coalesced(("test", 1), fetch)
+
+    assert len(calls) == 1
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert ("test", 1) not in http_session._INFLIGHT
+
+
+def test_coalesce_shares_the_exception_and_retries_afterwards():
+    def fail():
+        time.sleep(0.2)
+        raise requests.exceptions.ConnectionError("down")
+
+    outcomes = run_coalesced(("test", 2), fail)
+
+    assert all(isinstance(outcome, requests.exceptions.ConnectionError) for outcome in outcomes)
+    assert ("test", 2) not in http_session._INFLIGHT
+    # A failed call is not remembered, the next caller fetches again
+    assert http_session.coalesce(("test", 2), lambda: "ok") == "ok"
+
+
+def test_missing_poll_is_cached_until_its_ttl_expires(fake_session, monkeypatch):
+    monkeypatch.setattr(vote_and_results, "RESULTS_NOT_FOUND_TTL", 0.1)
+    session = fake_session(lambda method, url, kwargs: FakeResponse(404))
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Poll not found"):
+            vote_and_results.get_poll_results(1, base_url=BASE_URL)
+    assert len(session.calls) == 1
+    assert vote_and_results._RESULTS_CACHE[(BASE_URL, 1)] is vote_and_results._NOT_FOUND
+
+    time.sleep(0.2)
+    with pytest.raises(ValueError, match="Poll not found"):
+        vote_and_results.get_poll_results(1, base_url=BASE_URL)
+    assert len(session.calls) == 2
+
+
+
+def test_prefetch_thread_stops_when_the_consumer_closes_the_generator(fake_session):
+    # Every page is full, so only closing the generator ends the listing
+    fake_session(lambda method, url, kwargs: FakeResponse(200, POLLS_PAGE))
+
+    pages = fetch_polls.fetch_all_polls_iter(base_url=BASE_URL, batch_size=1, prefetch=1)
+    assert len(next(pages)) == 1
+    pages.close()
+
+    for thread in threading.enumerate():
+        if thread.name == "fetch-polls-prefetch":
+            thread.join(timeout=2)
+            assert not thread.is_alive()
+
+
+def test_get_poll_results_many_reports_failures_per_poll(fake_async_client):
+    def handler(request):
+        poll_id = int(request.url.path.split("/")[2])
+        if poll_id == 1:
+            return httpx.Response(200, content=RESULTS_BODY)
+        return httpx.Response(404 if poll_id == 2 else 500)
+
+    fake_async_client(handler)
+
+    results = vote_and_results.get_poll_results_many([1, 2, 3, 1], base_url=BASE_URL)
+
+    assert list(results) == [1, 2, 3]
+    assert results[1].poll_id == 1
+    assert isinstance(results[2], ValueError)
+    assert isinstance(results[3], requests.exceptions.RequestException)
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_fetch_all_polls_rejects_concurrency_below_one(fake_session, concurrency):
+    session = fake_session(lambda method, url, kwargs: FakeResponse(200, POLLS_PAGE))
+
+    with pytest.raises(ValueError, match="concurrency"):
+        fetch_polls.fetch_all_polls(base_url=BASE_URL, concurrency=concurrency)
+    assert session.calls == []
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_fetch_all_polls_async_rejects_concurrency_below_one(fake_async_client, concurrency):
+    calls = []
+    fake_async_client(lambda request: calls.append(request) or httpx.Response(200, content=POLLS_PAGE))
+
+    with pytest.raises(ValueError, match="concurrency"):
+        http_session.run_async(fetch_polls.fetch_all_polls_async(base_url=BASE_URL, concurrency=concurrency))
+    assert calls == []
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_cast_vote_many_rejects_concurrency_below_one(fake_async_client, concurrency):
+    calls = []
+    fake_async_client(lambda request: calls.append(request) or httpx.Response(200))
+
+    with pytest.raises(ValueError, match="concurrency"):
+        vote_and_results.cast_vote_many([(1, 1)], token="t", base_url=BASE_URL, concurrency=concurrency)
+    assert calls == []
+
+
+VOTE_BODY = b'{"id": 1, "user_id": 1, "option_id": 2, "created_at": "2026-01-01T00:00:00"}'
+
+
+def test_cast_vote_many_returns_one_outcome_per_vote_in_order(fake_async_client):
+    statuses = {1: 200, 2: 404, 3: 401}
+
+    def handler(request):
+        status = statuses[int(request.url.path.split("/")[2])]
+        return httpx.Response(status, content=VOTE_BODY if status == 200 else b"")
+
+    fake_async_client(handler)
+
+    outcomes = vote_and_results.cast_vote_many([(3, 1), (1, 2), (2, 1), (1, 2)], token="t", base_url=BASE_URL)
+
+    assert len(outcomes) == 4
+    assert str(outcomes[0]) == "Unauthorized: Invalid or missing JWT token"
+    assert outcomes[1].option_id == 2
+    assert str(outcomes[2]) == "Poll or option not found"
+    assert outcomes[3].option_id == 2
+
+
+def test_cast_vote_many_keeps_at_most_concurrency_votes_in_flight(fake_async_client):
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, content=VOTE_BODY)
+
+    fake_async_client(handler)
+
+    outcomes = vote_and_results.cast_vote_many([(1, 2)] * 20, token="t", base_url=BASE_URL, concurrency=3)
+
+    assert all(outcome.option_id == 2 for outcome in outcomes)
+    assert peak == 3
+
+
+def api_handler(method, url, kwargs):
+    """Answer every endpoint the client calls with a minimal valid response."""
+    if url.endswith("/register"):
+        return FakeResponse(200, b'{"id": 1, "username": "alice"}')
+    if url.endswith("/login"):
+        token = make_jwt({"sub": kwargs["data"]["username"], "exp": time.time() + 3600})
+        return FakeResponse(200, json.dumps({"access_token": token}).encode())
+    if url.endswith("/vote"):
+        return FakeResponse(200, VOTE_BODY)
+    if url.endswith("/results"):
+        return FakeResponse(200, RESULTS_BODY)
+    return FakeResponse(200, POLLS_PAGE)
+
+
+def exercise(api):
+    api.register_user("alice", "secret")
+    api.get_vote_token("alice", "secret")
+    api.fetch_polls(skip=5, limit=5)
+    api.cast_vote(1, 2, "t")
+    api.get_poll_results(1)
+
+
+class FunctionAPI:
+    """The module-level functions bound to BASE_URL, shaped like PollyClient."""
+
+    def register_user(self, username, password):
+        return register_user.register_user(username, password, base_url=BASE_URL)
+
+    def get_vote_token(self, username, password):
+        return vote_and_results.get_vote_token(username, password, base_url=BASE_URL)
+
+    def fetch_polls(self, skip, limit):
+        return fetch_polls.fetch_polls(skip=skip, limit=limit, base_url=BASE_URL)
+
+    def cast_vote(self, poll_id, option_id, token):
+        return vote_and_results.cast_vote(poll_id, option_id, token, base_url=BASE_URL)
+
+    def get_poll_results(self, poll_id):
+        return vote_and_results.get_poll_results(poll_id, base_url=BASE_URL)
+
+
+def test_polly_client_requests_the_same_urls_as_the_functions(fake_session):
+    session = fake_session(api_handler)
+    exercise(FunctionAPI())
+    expected = [(method, url, kwargs.get("params")) for method, url, kwargs in session.calls]
+    assert len(expected) == 5
+
+    for base_url in (BASE_URL, BASE_URL + "/"):
+        reset_caches()
+        session = fake_session(api_handler)
+        exercise(polly_client.PollyClient(base_url, prewarm=False))
+        assert [(method, url, kwargs.get("params")) for method, url, kwargs in session.calls] == expected
+
+
+def test_polly_client_vote_drops_results_cached_by_the_function_api(fake_session):
+    counts = iter([0, 1])
+
+    def handler(method, url, kwargs):
+        if method == "POST":
+            return FakeResponse(200, VOTE_BODY)
+        body = f'{{"poll_id": 1, "question": "Q", "results": [{{"option_id": 2, "text": "b", "vote_count": {next(counts)}}}]}}'
+        return FakeResponse(200, body.encode())
+
+    fake_session(handler)
+    client = polly_client.PollyClient(BASE_URL + "/", prewarm=False)
+
+    assert vote_and_results.get_poll_results(1, base_url=BASE_URL).results[0].vote_count == 0
+    client.cast_vote(1, 2, "t")
+    assert vote_and_results.get_poll_results(1, base_url=BASE_URL).results[0].vote_count == 1
+
+
+def test_polly_client_shares_the_token_cache_with_the_function_api(fake_session):
+    session = fake_session(api_handler)
+    client = polly_client.PollyClient(BASE_URL + "/", prewarm=False)
+
+    token = client.get_vote_token("alice", "secret")
+
+    assert vote_and_results.get_vote_token("alice", "secret", base_url=BASE_URL) == token
+    assert client.get_vote_token("alice", "secret") == token
+    assert len(session.calls) == 1
+
+
+def test_polly_client_warms_its_base_url_on_construction(monkeypatch):
+    warmed = []
+    monkeypatch.setattr(polly_client, "warm", warmed.append)
+
+    polly_client.PollyClient(BASE_URL + "/")
+    polly_client.PollyClient(BASE_URL, prewarm=False)
+
+    assert warmed == [BASE_URL]
+
+
+def polls_listing(total):
+    """A handler serving polls 1..total through skip/limit pagination."""
+
+    def handler(method, url, kwargs):
+        skip, limit = kwargs["params"]["skip"], kwargs["params"]["limit"]
+        page = [
+            {"id": poll_id, "question": "Q", "created_at": "2026-01-01T00:00:00", "owner_id": 1}
+            for poll_id in range(skip + 1, min(skip + limit, total) + 1)
+        ]
+        return FakeResponse(200, json.dumps(page).encode())
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    "total, last_offset",
+    [
+        # 2.5 waves: the short page at offset 14 sits mid-wave, offset 16 completes that wave
+        (15, 16),
+        # The empty page at offset 8 sits mid-wave, offset 10 completes that wave
+        (8, 10),
+    ],
+)
+def test_fetch_all_polls_reads_waves_in_server_order(fake_session, total, last_offset):
+    session = fake_session(polls_listing(total))
+
+    polls = fetch_polls.fetch_all_polls(base_url=BASE_URL, batch_size=2, concurrency=3)
+
+    assert [poll.id for poll in polls] == list(range(1, total + 1))
+    # No wave is started after the one holding the last page
+    offsets = sorted(kwargs["params"]["skip"] for method, url, kwargs in session.calls)
+    assert offsets == list(range(0, last_offset + 1, 2))
+
+
+# The printers as they were before the single-write rewrite, kept verbatim as
+# the reference output format
+def baseline_print_polls_summary(polls):
+    if not polls:
+        print("No polls found.")
+        return
+
+    print(f"Found {len(polls)} polls:")
+    print("-" * 50)
+
+    for poll in polls:
+        print(f"ID: {poll.get('id', 'N/A')}")
+        print(f"Question: {poll.get('question', 'N/A')}")
+        print(f"Created: {poll.get('created_at', 'N/A')}")
+        print(f"Owner ID: {poll.get('owner_id', 'N/A')}")
+
+        options = poll.get('options', [])
+        print(f"Options ({len(options)}):")
+        for option in options:
+            print(f"  - {option.get('text', 'N/A')} (ID: {option.get('id', 'N/A')})")
+
+        print("-" * 50)
+
+
+def baseline_print_poll_results(results):
+    if not results:
+        print("No results available.")
+        return
+
+    poll_id = results.get('poll_id', 'N/A')
+    question = results.get('question', 'N/A')
+    results_data = results.get('results', [])
+
+    print(f"Poll #{poll_id}: {question}")
+    print("=" * 50)
+
+    if not results_data:
+        print("No votes cast yet.")
+        return
+
+    sorted_results = sorted(results_data, key=lambda x: x.get('vote_count', 0), reverse=True)
+
+    total_votes = sum(option.get('vote_count', 0) for option in results_data)
+    print(f"Total votes: {total_votes}")
+    print("-" * 30)
+
+    for i, option in enumerate(sorted_results, 1):
+        option_id = option.get('option_id', 'N/A')
+        text = option.get('text', 'N/A')
+        vote_count = option.get('vote_count', 0)
+        percentage = (vote_count / total_votes * 100) if total_votes > 0 else 0
+
+        print(f"{i}. {text}")
+        print(f"   Votes: {vote_count} ({percentage:.1f}%)")
+        print(f"   Option ID: {option_id}")
+        print()
+
+
+def printed(capsys, printer, *args):
+    capsys.readouterr()
+    printer(*args)
+    return capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "polls",
+    [
+        [],
+        [
+            Poll(1, "Lunch?", "2026-01-01T00:00:00", 7, (Option(1, "Pizza", 1), Option(2, "Soup", 1))),
+            Poll(2, "No options yet", "2026-01-02T00:00:00", 8),
+        ],
+    ],
+)
+def test_print_polls_summary_matches_the_baseline_format(capsys, polls):
+    expected = printed(capsys, baseline_print_polls_summary, msgspec.to_builtins(polls))
+
+    assert printed(capsys, fetch_polls.print_polls_summary, polls) == expected
+
+
+@pytest.mark.parametrize(
+    "results",
+    [
+        PollResults(1, "Lunch?"),
+        PollResults(1, "Lunch?", (OptionResult(1, "Pizza"), OptionResult(2, "Soup"))),
+        PollResults(1, "Lunch?", (OptionResult(1, "Pizza", 2), OptionResult(2, "Soup", 5), OptionResult(3, "Salad", 2))),
+    ],
+)
+def test_print_poll_results_matches_the_baseline_format(capsys, results):
+    expected = printed(capsys, baseline_print_poll_results, msgspec.to_builtins(results))
+
+    assert printed(capsys, vote_and_results.print_poll_results, results) == expected
+
+
+def test_print_poll_results_without_results_matches_the_baseline_format(capsys):
+    assert printed(capsys, vote_and_results.print_poll_results, None) == printed(capsys, baseline_print_poll_results, None)
+
+
+def finish_leader_before_coalescing(monkeypatch, module, cache, key, value):
+    """Store value as if another leader finished between a caller's miss and its coalesce call."""
+    real_coalesce = module.coalesce
+
+    def coalesce(inflight_key, fetch):
+        cache[key] = value
+        return real_coalesce(inflight_key, fetch)
+
+    monkeypatch.setattr(module, "coalesce", coalesce)
+
+
+def test_polls_leader_rechecks_the_cache_before_fetching(fake_session, monkeypatch):
+    session = fake_session(lambda method, url, kwargs: FakeResponse(200, POLLS_PAGE))
+    page = fetch_polls._POLLS_DECODER.decode(POLLS_PAGE)
+    finish_leader_before_coalescing(monkeypatch, fetch_polls, fetch_polls._POLLS_CACHE, (BASE_URL + "/polls", 0, 10), page)
+
+    assert fetch_polls.fetch_polls(base_url=BASE_URL) == list(page)
+    assert session.calls == []
+
+
+def test_results_leader_rechecks_the_cache_before_fetching(fake_session, monkeypatch):
+    session = fake_session(lambda method, url, kwargs: FakeResponse(200, RESULTS_BODY))
+    results = vote_and_results._RESULTS_DECODER.decode(RESULTS_BODY)
+    finish_leader_before_coalescing(monkeypatch, vote_and_results, vote_and_results._RESULTS_CACHE, (BASE_URL, 1), results)
+
+    assert vote_and_results.get_poll_results(1, base_url=BASE_URL) == results
+    assert session.calls == []
+
+
+def test_print_poll_results_rejects_negative_top_k(capsys):
+    results = PollResults(1, "Lunch?", (OptionResult(1, "Pizza", 2), OptionResult(2, "Soup", 5), OptionResult(3, "Salad", 2)))
+
+    with pytest.raises(ValueError, match="top_k"):
+        vote_and_results.print_poll_results(results, top_k=-1)
+    assert capsys.readouterr().out == ""
+
+    # None and 0 both print every option
+    assert printed(capsys, vote_and_results.print_poll_results, results, 0) == printed(
+        capsys, vote_and_results.print_poll_results, results, None
+    )
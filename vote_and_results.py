@@ -7,8 +7,14 @@ from the Polly API. It handles authentication and follows the OpenAPI specificat
 Functions:
     cast_vote: Main function to cast a vote on a poll with JWT authentication
     cast_vote_with_error_handling: Convenience function that returns None on failure
+    cast_vote_async: Async variant of cast_vote over the shared HTTP/2 client
+    cast_vote_many: Cast several votes concurrently, collecting per-vote errors
     get_poll_results: Function to retrieve poll results and vote counts
+    get_poll_results_async: Async variant of get_poll_results over the shared HTTP/2 client
+    get_poll_results_many: Retrieve the results of several polls concurrently
     get_poll_results_with_error_handling: Convenience function that returns None on failure
+    get_vote_token: Log in and return a JWT token, reusing a cached one until it expires
+    invalidate_token: Forget a cached token to force a fresh login
 
 Example:
     # Cast a vote (requires JWT token)
@@ -24,12 +30,47 @@ Example:
         print(f"Poll results: {results}")
 """
 
+import asyncio
+import base64
+import hashlib
+import hmac
+import sys
+import threading
+import time
+from functools import lru_cache
+import httpx
 import requests
-import json
-from typing import Dict, Any, Optional, List
+import msgspec
+import numpy as np
+import orjson
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from cachetools import LRUCache, TLRUCache
 
-def cast_vote(poll_id: int, option_id: int, token: str, base_url: str = "http://localhost:8000") -> Dict[str, Any]:
+from client_schemas import PollResults, VoteOut
+from http_session import async_request, coalesce, get_session, run_async
+
+
+# Built once at import; decode responses straight into their schema structs
+_VOTE_DECODER = msgspec.json.Decoder(VoteOut)
+_RESULTS_DECODER = msgspec.json.Decoder(PollResults)
+
+
+@lru_cache(maxsize=1024)
+def _vote_body(option_id: int) -> bytes:
+    """
+    Serialize a VoteCreate body once per option and reuse the bytes.
+    
+    Args:
+        option_id (int): The ID of the option to vote for
+    
+    Returns:
+        bytes: The JSON-encoded request body
+    """
+    return orjson.dumps({"option_id": option_id})
+
+
+def cast_vote(poll_id: int, option_id: int, token: str, base_url: str = "http://localhost:8000") -> VoteOut:
     """
     Cast a vote on an existing poll via the /polls/{poll_id}/vote endpoint.
     
@@ -40,19 +81,31 @@ def cast_vote(poll_id: int, option_id: int, token: str, base_url: str = "http://
         base_url (str): The base URL of the API (default: "http://localhost:8000")
     
     Returns:
-        Dict[str, Any]: The response data containing vote information (VoteOut schema)
+        VoteOut: The vote information (VoteOut schema)
         
     Raises:
         requests.exceptions.RequestException: If the request fails
         ValueError: If the vote fails (e.g., poll/option not found, unauthorized)
     """
-    url = f"{base_url}/polls/{poll_id}/vote"
+    return _cast_vote(f"{base_url}/polls/{poll_id}/vote", base_url, poll_id, option_id, token)
+
+
+def _cast_vote(url: str, base_url: str, poll_id: int, option_id: int, token: str) -> VoteOut:
+    """
+    Cast a vote using a prebuilt /polls/{poll_id}/vote URL.
     
-    # Prepare the request data according to VoteCreate schema
-    data = {
-        "option_id": option_id
-    }
+    Shared by cast_vote and PollyClient.cast_vote.
+    
+    Args:
+        url (str): The /polls/{poll_id}/vote endpoint URL
+        base_url (str): The base URL of the API
+        poll_id (int): The ID of the poll to vote on
+        option_id (int): The ID of the option to vote for
+        token (str): JWT authentication token
     
+    Returns:
+        VoteOut: The vote information (VoteOut schema)
+    """
     # Set headers for JSON content and JWT authentication
     headers = {
         "Content-Type": "application/json",
@@ -61,25 +114,132 @@ def cast_vote(poll_id: int, option_id: int, token: str, base_url: str = "http://
     
     try:
         # Make the POST request
-        response = requests.post(url, json=data, headers=headers)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            # Return the vote data (VoteOut schema)
-            return response.json()
-        elif response.status_code == 401:
-            raise ValueError("Unauthorized: Invalid or missing JWT token")
-        elif response.status_code == 404:
-            raise ValueError("Poll or option not found")
-        else:
-            # Other error status codes
-            response.raise_for_status()
-            
+        response = get_session().post(url, data=_vote_body(option_id), headers=headers)
+        return _parse_vote_response(response, token, (base_url, poll_id))
     except requests.exceptions.RequestException as e:
         raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
 
 
-def cast_vote_with_error_handling(poll_id: int, option_id: int, token: str, base_url: str = "http://localhost:8000") -> Optional[Dict[str, Any]]:
+def _parse_vote_response(response: Any, token: str, results_key: tuple) -> VoteOut:
+    """
+    Handle a vote response from either requests or httpx.
+    
+    A successful vote drops the poll's cached results, so the next
+    get_poll_results call sees the new counts.
+    
+    Args:
+        response (Any): The HTTP response for the vote request
+        token (str): The JWT token the vote was sent with
+        results_key (tuple): Key of the poll's entry in the results cache
+    
+    Returns:
+        VoteOut: The vote information (VoteOut schema)
+    """
+    # Check if the request was successful
+    if response.status_code == 200:
+        with _RESULTS_CACHE_LOCK:
+            _RESULTS_CACHE.pop(results_key, None)
+        
+        # Return the vote data (VoteOut schema)
+        try:
+            return _VOTE_DECODER.decode(response.content)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid vote response: {e}")
+    elif response.status_code == 401:
+        # Make sure a rejected token is not handed out again
+        _forget_token(token)
+        raise ValueError("Unauthorized: Invalid or missing JWT token")
+    elif response.status_code == 404:
+        raise ValueError("Poll or option not found")
+    else:
+        # Other error status codes
+        response.raise_for_status()
+
+
+async def cast_vote_async(poll_id: int, option_id: int, token: str, base_url: str = "http://localhost:8000") -> VoteOut:
+    """
+    Async variant of cast_vote using the shared HTTP/2 httpx.AsyncClient.
+    
+    Args:
+        poll_id (int): The ID of the poll to vote on
+        option_id (int): The ID of the option to vote for
+        token (str): JWT authentication token
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+    
+    Returns:
+        VoteOut: The vote information (VoteOut schema)
+        
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+        ValueError: If the vote fails (e.g., poll/option not found, unauthorized)
+    """
+    url = f"{base_url}/polls/{poll_id}/vote"
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}"
+    }
+    
+    try:
+        response = await async_request("POST", url, content=_vote_body(option_id), headers=headers)
+        return _parse_vote_response(response, token, (base_url, poll_id))
+    except httpx.HTTPError as e:
+        raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
+
+
+async def cast_vote_many_async(votes: List[Tuple[int, int]], token: str, base_url: str = "http://localhost:8000", concurrency: int = 16) -> List[Union[VoteOut, Exception]]:
+    """
+    Cast several votes concurrently over the shared HTTP/2 client.
+    
+    At most ``concurrency`` votes are in flight at once. A failed vote does not
+    abort the others; its exception is returned in its place.
+    
+    Args:
+        votes (List[Tuple[int, int]]): (poll_id, option_id) pairs to vote for
+        token (str): JWT authentication token
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+        concurrency (int): Maximum number of votes in flight (default: 16)
+    
+    Returns:
+        List[Union[VoteOut, Exception]]: One entry per vote, in input order
+    
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def cast_one(poll_id: int, option_id: int) -> VoteOut:
+        async with semaphore:
+            return await cast_vote_async(poll_id, option_id, token, base_url)
+    
+    return await asyncio.gather(
+        *(cast_one(poll_id, option_id) for poll_id, option_id in votes),
+        return_exceptions=True,
+    )
+
+
+def cast_vote_many(votes: List[Tuple[int, int]], token: str, base_url: str = "http://localhost:8000", concurrency: int = 16) -> List[Union[VoteOut, Exception]]:
+    """
+    Synchronous wrapper around cast_vote_many_async.
+    
+    Args:
+        votes (List[Tuple[int, int]]): (poll_id, option_id) pairs to vote for
+        token (str): JWT authentication token
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+        concurrency (int): Maximum number of votes in flight (default: 16)
+    
+    Returns:
+        List[Union[VoteOut, Exception]]: One entry per vote, in input order
+    
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    return run_async(cast_vote_many_async(votes, token, base_url, concurrency))
+
+
+def cast_vote_with_error_handling(poll_id: int, option_id: int, token: str, base_url: str = "http://localhost:8000") -> Optional[VoteOut]:
     """
     Cast a vote with basic error handling that returns None on failure.
     
@@ -90,7 +250,7 @@ def cast_vote_with_error_handling(poll_id: int, option_id: int, token: str, base
         base_url (str): The base URL of the API (default: "http://localhost:8000")
     
     Returns:
-        Optional[Dict[str, Any]]: The response data on success, None on failure
+        Optional[VoteOut]: The vote information on success, None on failure
     """
     try:
         return cast_vote(poll_id, option_id, token, base_url)
@@ -99,42 +259,243 @@ def cast_vote_with_error_handling(poll_id: int, option_id: int, token: str, base
         return None
 
 
-def get_poll_results(poll_id: int, base_url: str = "http://localhost:8000") -> Dict[str, Any]:
+# Short-lived cache of poll results, keyed by (base_url, poll_id). Polls that
+# returned 404 are remembered as _NOT_FOUND for a shorter time. The stale
+# copy outlives the TTL and is served when the API cannot be reached.
+RESULTS_CACHE_TTL = 10
+RESULTS_NOT_FOUND_TTL = 5
+_NOT_FOUND = object()
+
+
+def _results_ttu(key: tuple, value: Any, now: float) -> float:
+    ttl = RESULTS_NOT_FOUND_TTL if value is _NOT_FOUND else RESULTS_CACHE_TTL
+    return now + ttl
+
+
+_RESULTS_CACHE: TLRUCache = TLRUCache(maxsize=512, ttu=_results_ttu)
+_RESULTS_STALE: LRUCache = LRUCache(maxsize=512)
+_RESULTS_CACHE_LOCK = threading.Lock()
+
+
+def _cached_results(cache_key: tuple) -> Optional[PollResults]:
+    """
+    Look up cached results, raising immediately for polls recently found missing.
+    
+    Args:
+        cache_key (tuple): Key under which the results are cached
+    
+    Returns:
+        Optional[PollResults]: The cached results, or None on a cache miss
+    """
+    with _RESULTS_CACHE_LOCK:
+        cached = _RESULTS_CACHE.get(cache_key)
+    if cached is _NOT_FOUND:
+        raise ValueError("Poll not found")
+    return cached
+
+
+def get_poll_results(poll_id: int, base_url: str = "http://localhost:8000", bypass_cache: bool = False) -> PollResults:
     """
     Retrieve poll results via the /polls/{poll_id}/results endpoint.
     
+    Results are cached in-process for RESULTS_CACHE_TTL seconds, and a 404 for
+    RESULTS_NOT_FOUND_TTL seconds. If the request fails, the last results seen
+    for the poll are returned instead, when available.
+    
     Args:
         poll_id (int): The ID of the poll to get results for
         base_url (str): The base URL of the API (default: "http://localhost:8000")
+        bypass_cache (bool): Skip the cache lookup and refresh the entry (default: False)
     
     Returns:
-        Dict[str, Any]: The response data containing poll results (PollResults schema)
+        PollResults: The poll results (PollResults schema)
         
     Raises:
         requests.exceptions.RequestException: If the request fails
         ValueError: If the poll is not found
     """
-    url = f"{base_url}/polls/{poll_id}/results"
+    return _get_poll_results(f"{base_url}/polls/{poll_id}/results", base_url, poll_id, bypass_cache)
+
+
+def _get_poll_results(url: str, base_url: str, poll_id: int, bypass_cache: bool) -> PollResults:
+    """
+    Serve poll results from the cache or fetch them from a prebuilt URL.
+    
+    Shared by get_poll_results and PollyClient.get_poll_results.
+    
+    Args:
+        url (str): The /polls/{poll_id}/results endpoint URL
+        base_url (str): The base URL of the API
+        poll_id (int): The ID of the poll to get results for
+        bypass_cache (bool): Skip the cache lookup and refresh the entry
+    
+    Returns:
+        PollResults: The poll results (PollResults schema)
+    """
+    cache_key = (base_url, poll_id)
+    
+    def fetch() -> PollResults:
+        # A previous leader may have stored the results since our miss
+        cached = None if bypass_cache else _cached_results(cache_key)
+        return cached if cached is not None else _request_poll_results(url, cache_key)
+    
+    if not bypass_cache:
+        cached = _cached_results(cache_key)
+        if cached is not None:
+            return cached
+    
+    # Concurrent misses for the same poll share a single request
+    return coalesce(("results",) + cache_key, fetch)
+
+
+def _request_poll_results(url: str, cache_key: tuple) -> PollResults:
+    """
+    Perform the results GET request and store the response in the cache.
+    
+    Args:
+        url (str): The /polls/{poll_id}/results endpoint URL
+        cache_key (tuple): Key under which the results are cached
     
+    Returns:
+        PollResults: The poll results (PollResults schema)
+    """
     try:
         # Make the GET request
-        response = requests.get(url)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            # Return the results data (PollResults schema)
-            return response.json()
-        elif response.status_code == 404:
-            raise ValueError("Poll not found")
-        else:
-            # Other error status codes
-            response.raise_for_status()
-            
+        response = get_session().get(url)
+        return _parse_results_response(response, cache_key)
     except requests.exceptions.RequestException as e:
-        raise requests.exceptions.RequestException(f"Request failed: {str(e)}")
+        return _stale_results_or_raise(cache_key, e)
+
+
+def _parse_results_response(response: Any, cache_key: tuple) -> PollResults:
+    """
+    Handle a results response and store successful results in the cache.
+    
+    Works with both requests and httpx responses; unexpected statuses raise the
+    respective library's HTTP error via raise_for_status.
+    
+    Args:
+        response (Any): The HTTP response for the results request
+        cache_key (tuple): Key under which the results are cached
+    
+    Returns:
+        PollResults: The poll results (PollResults schema)
+    """
+    # Check if the request was successful
+    if response.status_code == 200:
+        # Return the results data (PollResults schema)
+        try:
+            results_data = _RESULTS_DECODER.decode(response.content)
+        except msgspec.DecodeError as e:
+            raise ValueError(f"Invalid results response: {e}")
+        with _RESULTS_CACHE_LOCK:
+            _RESULTS_CACHE[cache_key] = results_data
+            _RESULTS_STALE[cache_key] = results_data
+        return results_data
+    elif response.status_code == 404:
+        # Answer repeated lookups locally; a deleted poll has no stale results
+        with _RESULTS_CACHE_LOCK:
+            _RESULTS_CACHE[cache_key] = _NOT_FOUND
+            _RESULTS_STALE.pop(cache_key, None)
+        raise ValueError("Poll not found")
+    else:
+        # Other error status codes
+        response.raise_for_status()
+
+
+def _stale_results_or_raise(cache_key: tuple, error: Exception) -> PollResults:
+    """
+    Return the last known results for a poll, or raise RequestException if there are none.
+    
+    Args:
+        cache_key (tuple): Key under which the results are cached
+        error (Exception): The error that made the request fail
+    
+    Returns:
+        PollResults: The last results seen for the poll
+    """
+    # Fall back to the last known results rather than failing outright
+    with _RESULTS_CACHE_LOCK:
+        stale = _RESULTS_STALE.get(cache_key)
+    if stale is not None:
+        return stale
+    raise requests.exceptions.RequestException(f"Request failed: {str(error)}")
+
+
+async def get_poll_results_async(poll_id: int, base_url: str = "http://localhost:8000", bypass_cache: bool = False) -> PollResults:
+    """
+    Async variant of get_poll_results using the shared HTTP/2 httpx.AsyncClient.
+    
+    Shares the results cache and stale fallback with get_poll_results and
+    raises the same exceptions.
+    
+    Args:
+        poll_id (int): The ID of the poll to get results for
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+        bypass_cache (bool): Skip the cache lookup and refresh the entry (default: False)
+    
+    Returns:
+        PollResults: The poll results (PollResults schema)
+        
+    Raises:
+        requests.exceptions.RequestException: If the request fails
+        ValueError: If the poll is not found
+    """
+    url = f"{base_url}/polls/{poll_id}/results"
+    cache_key = (base_url, poll_id)
+    
+    if not bypass_cache:
+        cached = _cached_results(cache_key)
+        if cached is not None:
+            return cached
+    
+    try:
+        response = await async_request("GET", url)
+        return _parse_results_response(response, cache_key)
+    except httpx.HTTPError as e:
+        return _stale_results_or_raise(cache_key, e)
+
+
+async def get_poll_results_many_async(poll_ids: List[int], base_url: str = "http://localhost:8000") -> Dict[int, Union[PollResults, Exception]]:
+    """
+    Retrieve the results of several polls concurrently.
+    
+    All requests are gathered on the shared HTTP/2 client, so K polls cost about
+    one round-trip instead of K. Duplicate IDs are requested once. A failed
+    lookup does not abort the others; its exception is returned in its place.
+    
+    Args:
+        poll_ids (List[int]): The IDs of the polls to get results for
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+    
+    Returns:
+        Dict[int, Union[PollResults, Exception]]: Poll results or the error
+        raised for that poll (e.g. ValueError for a missing poll), keyed by poll ID
+    """
+    unique_ids = list(dict.fromkeys(poll_ids))
+    results = await asyncio.gather(
+        *(get_poll_results_async(poll_id, base_url) for poll_id in unique_ids),
+        return_exceptions=True,
+    )
+    return dict(zip(unique_ids, results))
+
+
+def get_poll_results_many(poll_ids: List[int], base_url: str = "http://localhost:8000") -> Dict[int, Union[PollResults, Exception]]:
+    """
+    Synchronous wrapper around get_poll_results_many_async.
+    
+    Args:
+        poll_ids (List[int]): The IDs of the polls to get results for
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+    
+    Returns:
+        Dict[int, Union[PollResults, Exception]]: Poll results or the error
+        raised for that poll, keyed by poll ID
+    """
+    return run_async(get_poll_results_many_async(poll_ids, base_url))
 
 
-def get_poll_results_with_error_handling(poll_id: int, base_url: str = "http://localhost:8000") -> Optional[Dict[str, Any]]:
+def get_poll_results_with_error_handling(poll_id: int, base_url: str = "http://localhost:8000") -> Optional[PollResults]:
     """
     Get poll results with basic error handling that returns None on failure.
     
@@ -143,7 +504,7 @@ def get_poll_results_with_error_handling(poll_id: int, base_url: str = "http://l
         base_url (str): The base URL of the API (default: "http://localhost:8000")
     
     Returns:
-        Optional[Dict[str, Any]]: The response data on success, None on failure
+        Optional[PollResults]: The poll results on success, None on failure
     """
     try:
         return get_poll_results(poll_id, base_url)
@@ -152,51 +513,141 @@ def get_poll_results_with_error_handling(poll_id: int, base_url: str = "http://l
         return None
 
 
-def print_poll_results(results: Dict[str, Any]) -> None:
+def _top_k_order(counts: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Return the indices of the top_k largest counts, largest first.
+    
+    Selects the candidates with a linear-time partition and only sorts those,
+    giving the same order as the first top_k entries of a stable full sort.
+    
+    Args:
+        counts (np.ndarray): Vote count of each option
+        top_k (int): Number of options to keep, 0 < top_k < len(counts)
+    
+    Returns:
+        np.ndarray: Indices into counts
+    """
+    # Vote count of the top_k-th option
+    threshold = np.partition(counts, len(counts) - top_k)[len(counts) - top_k]
+    above = np.flatnonzero(counts > threshold)
+    # Ties at the threshold are taken in server order, as a stable sort would
+    ties = np.flatnonzero(counts == threshold)[:top_k - len(above)]
+    candidates = np.concatenate((above, ties))
+    return candidates[np.argsort(-counts[candidates], kind="stable")]
+
+
+def print_poll_results(results: Optional[PollResults], top_k: Optional[int] = None) -> None:
     """
     Print poll results in a readable format.
     
     Args:
-        results (Dict[str, Any]): Poll results data from get_poll_results
+        results (Optional[PollResults]): Poll results from get_poll_results
+        top_k (Optional[int]): Only print the top_k options by vote count; None or 0 prints all (default: None)
+    
+    Raises:
+        ValueError: If top_k is negative
     """
-    if not results:
+    if top_k is not None and top_k < 0:
+        raise ValueError(f"top_k must not be negative, got {top_k}")
+    
+    if results is None:
         print("No results available.")
         return
     
-    poll_id = results.get('poll_id', 'N/A')
-    question = results.get('question', 'N/A')
-    results_data = results.get('results', [])
+    poll_id = results.poll_id
+    question = results.question
+    results_data = results.results
     
-    print(f"Poll #{poll_id}: {question}")
-    print("=" * 50)
+    # Build the whole report first and write it in one call
+    parts = [f"Poll #{poll_id}: {question}\n{'=' * 50}\n"]
     
     if not results_data:
-        print("No votes cast yet.")
+        parts.append("No votes cast yet.\n")
+        sys.stdout.write("".join(parts))
         return
     
-    # Sort by vote count (descending)
-    sorted_results = sorted(results_data, key=lambda x: x.get('vote_count', 0), reverse=True)
+    # Tally all options at once
+    counts = np.fromiter((option.vote_count for option in results_data), dtype=np.int64, count=len(results_data))
+    total_votes = int(counts.sum())
+    percentages = counts / total_votes * 100 if total_votes > 0 else np.zeros(len(counts))
     
-    total_votes = sum(option.get('vote_count', 0) for option in results_data)
-    print(f"Total votes: {total_votes}")
-    print("-" * 30)
+    # Sort by vote count (descending); a stable sort keeps ties in server order
+    if top_k is not None and 0 < top_k < len(counts):
+        order = _top_k_order(counts, top_k)
+    else:
+        order = np.argsort(-counts, kind="stable")
     
-    for i, option in enumerate(sorted_results, 1):
-        option_id = option.get('option_id', 'N/A')
-        text = option.get('text', 'N/A')
-        vote_count = option.get('vote_count', 0)
-        percentage = (vote_count / total_votes * 100) if total_votes > 0 else 0
-        
-        print(f"{i}. {text}")
-        print(f"   Votes: {vote_count} ({percentage:.1f}%)")
-        print(f"   Option ID: {option_id}")
-        print()
+    parts.append(f"Total votes: {total_votes}\n{'-' * 30}\n")
+    
+    for i, index in enumerate(order, 1):
+        option = results_data[index]
+        parts.append(
+            f"{i}. {option.text}\n"
+            f"   Votes: {int(counts[index])} ({percentages[index]:.1f}%)\n"
+            f"   Option ID: {option.option_id}\n"
+            "\n"
+        )
+    
+    sys.stdout.write("".join(parts))
+
+
+# Tokens from /login, keyed by (username, base_url). Each entry holds the
+# token, its expiry and a digest of the password it was issued for.
+TOKEN_EXPIRY_MARGIN = 30
+_TOKEN_CACHE: Dict[Tuple[str, str], Tuple[str, float, bytes]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """
+    Read the exp claim from a JWT without verifying its signature.
+    
+    Args:
+        token (str): The encoded JWT
+    
+    Returns:
+        Optional[float]: The expiry as a Unix timestamp, or None if it cannot be read
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def invalidate_token(username: str, base_url: str = "http://localhost:8000") -> None:
+    """
+    Drop the cached token of a user so the next get_vote_token call logs in again.
+    
+    Args:
+        username (str): Username whose token should be forgotten
+        base_url (str): The base URL of the API (default: "http://localhost:8000")
+    """
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE.pop((username, base_url), None)
+
+
+def _forget_token(token: str) -> None:
+    """
+    Drop every cached entry holding the given token, e.g. after a 401.
+    
+    Args:
+        token (str): The rejected JWT token
+    """
+    with _TOKEN_CACHE_LOCK:
+        for key in [key for key, entry in _TOKEN_CACHE.items() if entry[0] == token]:
+            del _TOKEN_CACHE[key]
 
 
 def get_vote_token(username: str, password: str, base_url: str = "http://localhost:8000") -> Optional[str]:
     """
     Helper function to get a JWT token for voting by logging in.
     
+    Tokens are cached per (username, base_url) and reused until
+    TOKEN_EXPIRY_MARGIN seconds before their exp claim, as long as the same
+    password is supplied. Use invalidate_token to force a fresh login.
+    
     Args:
         username (str): Username for login
         password (str): Password for login
@@ -205,7 +656,33 @@ def get_vote_token(username: str, password: str, base_url: str = "http://localho
     Returns:
         Optional[str]: JWT token on success, None on failure
     """
-    url = f"{base_url}/login"
+    return _get_vote_token(f"{base_url}/login", base_url, username, password)
+
+
+def _get_vote_token(url: str, base_url: str, username: str, password: str) -> Optional[str]:
+    """
+    Return a cached token or log in using a prebuilt /login URL.
+    
+    Shared by get_vote_token and PollyClient.get_vote_token.
+    
+    Args:
+        url (str): The /login endpoint URL
+        base_url (str): The base URL of the API
+        username (str): Username for login
+        password (str): Password for login
+    
+    Returns:
+        Optional[str]: JWT token on success, None on failure
+    """
+    cache_key = (username, base_url)
+    password_digest = hashlib.sha256(password.encode()).digest()
+    
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+    if cached is not None:
+        token, expires_at, cached_digest = cached
+        if time.time() < expires_at - TOKEN_EXPIRY_MARGIN and hmac.compare_digest(cached_digest, password_digest):
+            return token
     
     # Prepare form data for login
     data = {
@@ -218,11 +695,17 @@ def get_vote_token(username: str, password: str, base_url: str = "http://localho
     }
     
     try:
-        response = requests.post(url, data=data, headers=headers)
+        response = get_session().post(url, data=data, headers=headers)
         
         if response.status_code == 200:
-            token_data = response.json()
-            return token_data.get('access_token')
+            token_data = orjson.loads(response.content)
+            token = token_data.get('access_token')
+            
+            expires_at = _token_expiry(token) if token else None
+            if expires_at is not None:
+                with _TOKEN_CACHE_LOCK:
+                    _TOKEN_CACHE[cache_key] = (token, expires_at, password_digest)
+            return token
         else:
             print(f"Login failed: {response.status_code}")
             return None